@@ -2,13 +2,15 @@
 
 import argparse
 import asyncio
-import json
 import logging
 import sys
+from collections import Counter
 from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import Any
 
+from pydantic_core import to_json
+
 from scan_test_action.definition_loader import load_test_definition
 from scan_test_action.models.definition import TestDefinition
 from scan_test_action.orchestrator import ScannerResult, TestOrchestrator
@@ -22,29 +24,33 @@ STATUS_SYMBOLS = {
     "timeout": "⏱️",
 }
 
+# Statuses that make the action exit with a non-zero code
+FAILURE_STATUSES = frozenset({"failure", "error", "timeout"})
+
 
 def log_results_summary(
     log: logging.Logger, scanner_results: Sequence[ScannerResult]
 ) -> None:
-    """Log a formatted summary of test results with pipeline URLs."""
-    log.info("=" * 80)
-    log.info("Test Results Summary:")
-    log.info("=" * 80)
+    """Log a formatted summary of test results with pipeline URLs.
+
+    The summary is emitted as a single multi-line record.
+    """
+    rule = "=" * 80
+    lines = [rule, "Test Results Summary:", rule]
 
     for scanner_result in scanner_results:
         for test_result in scanner_result.results:
             symbol = STATUS_SYMBOLS.get(test_result.status, "?")
-            log.info(
-                "%s %s: %s (%.2fs)",
-                symbol,
-                scanner_result.scanner_id,
-                test_result.status,
-                test_result.duration,
+            lines.append(
+                f"{symbol} {scanner_result.scanner_id}: "
+                f"{test_result.status} ({test_result.duration:.2f}s)"
             )
             if test_result.run_url:
-                log.info("  Run URL: %s", test_result.run_url)
+                lines.append(f"  Run URL: {test_result.run_url}")
             if test_result.message:
-                log.info("  Message: %s", test_result.message)
+                lines.append(f"  Message: {test_result.message}")
+
+    log.info("\n".join(lines))
 
 
 def parse_fallback_scanners(fallback_scanners: str) -> Sequence[str]:
@@ -69,8 +75,7 @@ async def run(
     log.info("Loading provider: %s", provider_key)
     manifest = load_provider_manifest(provider_key)
 
-    config_dict = json.loads(provider_config_json)
-    config = manifest.config_cls(**config_dict)
+    config = manifest.config_cls.model_validate_json(provider_config_json)
 
     log.info("Detecting changed scanners (base_ref=%s)", base_ref)
     changed_scanners = await get_scanners_to_test(
@@ -79,7 +84,7 @@ async def run(
 
     if not changed_scanners:
         log.info("No changed scanners detected")
-        print(json.dumps({"total": 0, "results": []}))
+        print(to_json({"total": 0, "results": []}, indent=2).decode())
         return 0
 
     log.info("Changed scanners: %s", ", ".join(changed_scanners))
@@ -89,7 +94,7 @@ async def run(
 
     if not test_definitions:
         log.info("No test definitions found for changed scanners")
-        print(json.dumps({"total": 0, "results": []}))
+        print(to_json({"total": 0, "results": []}, indent=2).decode())
         return 0
 
     log.info("Running tests for %d scanner(s)...", len(test_definitions))
@@ -103,10 +108,10 @@ async def run(
     log_results_summary(log, scanner_results)
 
     output = format_output(scanner_results)
-    print(json.dumps(output, indent=2))
+    print(to_json(output, indent=2).decode())
 
     has_failures = any(
-        result.status in {"failure", "error", "timeout"}
+        result.status in FAILURE_STATUSES
         for scanner_result in scanner_results
         for result in scanner_result.results
     )
@@ -117,23 +122,33 @@ async def run(
 async def load_test_definitions(
     registry_path: Path, scanner_ids: Sequence[str]
 ) -> Mapping[str, TestDefinition]:
-    """Load test definitions for the given scanners."""
+    """Load test definitions for the given scanners, once per scanner ID.
+
+    Definitions are loaded concurrently; scanners without one are skipped.
+    """
+    unique_ids = list(dict.fromkeys(scanner_ids))
+    loaded = await asyncio.gather(
+        *(load_test_definition(registry_path, scanner_id) for scanner_id in unique_ids),
+        return_exceptions=True,
+    )
+
     definitions: dict[str, TestDefinition] = {}
-    for scanner_id in scanner_ids:
-        try:
-            definitions[scanner_id] = await load_test_definition(
-                registry_path, scanner_id
-            )
-        except FileNotFoundError:
-            pass
+    for scanner_id, definition in zip(unique_ids, loaded, strict=True):
+        if isinstance(definition, FileNotFoundError):
+            continue
+        if isinstance(definition, BaseException):
+            raise definition
+        definitions[scanner_id] = definition
     return definitions
 
 
 def format_output(scanner_results: Sequence[ScannerResult]) -> dict[str, Any]:
     """Format scanner results for JSON output."""
     all_results: list[dict[str, Any]] = []
+    counts: Counter[str] = Counter()
     for scanner_result in scanner_results:
         for test_result in scanner_result.results:
+            counts[test_result.status] += 1
             all_results.append(
                 {
                     "scanner": scanner_result.scanner_id,
@@ -146,10 +161,10 @@ def format_output(scanner_results: Sequence[ScannerResult]) -> dict[str, Any]:
 
     return {
         "total": len(all_results),
-        "passed": sum(1 for r in all_results if r["status"] == "success"),
-        "failed": sum(1 for r in all_results if r["status"] == "failure"),
-        "errors": sum(1 for r in all_results if r["status"] == "error"),
-        "timeouts": sum(1 for r in all_results if r["status"] == "timeout"),
+        "passed": counts["success"],
+        "failed": counts["failure"],
+        "errors": counts["error"],
+        "timeouts": counts["timeout"],
         "results": all_results,
     }
 
@@ -1,11 +1,15 @@
 """Load and parse test definitions from YAML files."""
 
+import asyncio
 from pathlib import Path
 
 import yaml
 
 from scan_test_action.models.definition import TestDefinition
 
+# libyaml-backed loader when PyYAML was built with it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 async def load_test_definition(
     registry_path: Path,
@@ -30,9 +34,11 @@ async def load_test_definition(
     if not test_file.exists():
         raise FileNotFoundError(f"Test file not found: {test_file}")
 
+    # Read off the event loop so concurrent loads do not block each other
+    content = await asyncio.to_thread(test_file.read_text)
+
     try:
-        with test_file.open() as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(content, Loader=SafeLoader)  # noqa: S506
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in {test_file}: {e}") from e
 
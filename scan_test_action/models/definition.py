@@ -1,9 +1,10 @@
 """Models for test definitions loaded from tests.yaml files."""
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from itertools import chain
 from typing import Literal
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 from scan_test_action.models.base import Model
 
@@ -33,6 +34,24 @@ class Test(Model):
     )
     timeout: str = Field(default="5m", description="Test timeout (e.g., '300s', '5m')")
 
+    def matrix_entries(self) -> Iterator["MatrixEntry"]:
+        """Yield one matrix entry per scan path.
+
+        The values come from this already validated test, so entries are built
+        without running validation again.
+        """
+        name, type_, timeout = self.name, self.type, self.timeout
+        url, ref = self.source.url, self.source.ref
+        for scan_path in self.scan_paths:
+            yield MatrixEntry.model_construct(
+                test_name=name,
+                test_type=type_,
+                source_url=url,
+                source_ref=ref,
+                scan_path=scan_path,
+                timeout=timeout,
+            )
+
 
 class MatrixEntry(Model):
     """Single matrix entry representing one (test, scan_path) combination."""
@@ -49,6 +68,15 @@ class MatrixEntry(Model):
     timeout: str = Field(default="5m", description="Test timeout")
 
 
+def build_matrix_entries(tests: Sequence[Test]) -> Sequence[MatrixEntry]:
+    """Flatten tests into matrix entries (one per test/scan_path combo)."""
+    return list(chain.from_iterable(test.matrix_entries() for test in tests))
+
+
+# Built once; serializes a whole matrix to JSON in a single pydantic-core pass
+_MATRIX_ADAPTER: TypeAdapter[Sequence[MatrixEntry]] = TypeAdapter(Sequence[MatrixEntry])
+
+
 class TestDefinition(Model):
     """Complete test definition loaded from tests.yaml."""
 
@@ -59,17 +87,8 @@ class TestDefinition(Model):
 
     def to_matrix_entries(self) -> Sequence[MatrixEntry]:
         """Convert all tests into matrix entries (one per test/scan_path combo)."""
-        entries: list[MatrixEntry] = []
-        for test in self.tests:
-            for scan_path in test.scan_paths:
-                entries.append(
-                    MatrixEntry(
-                        test_name=test.name,
-                        test_type=test.type,
-                        source_url=test.source.url,
-                        source_ref=test.source.ref,
-                        scan_path=scan_path,
-                        timeout=test.timeout,
-                    )
-                )
-        return entries
+        return build_matrix_entries(self.tests)
+
+    def to_matrix_json(self) -> str:
+        """Serialize the matrix entries as a JSON array."""
+        return _MATRIX_ADAPTER.dump_json(self.to_matrix_entries()).decode()
@@ -1,7 +1,6 @@
 """Azure DevOps provider implementation."""
 
 import base64
-import json
 import logging
 from collections.abc import AsyncGenerator, Mapping, Sequence
 from contextlib import asynccontextmanager
@@ -70,16 +69,11 @@ class AzureDevOpsProvider(PipelineProvider[str]):
         registry_repo: str,
     ) -> str:
         """Dispatch pipeline run and return run ID for polling."""
-        matrix_entries = [
-            entry.model_dump(mode="json")
-            for entry in test_definition.to_matrix_entries()
-        ]
-
         template_params = {
             "SCANNER_ID": scanner_id,
             "REGISTRY_REF": registry_ref,
             "REGISTRY_REPO": registry_repo,
-            "MATRIX_TESTS": json.dumps(matrix_entries),
+            "MATRIX_TESTS": test_definition.to_matrix_json(),
         }
 
         url = (
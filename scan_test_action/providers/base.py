@@ -74,13 +74,14 @@ class PipelineProvider[T](ABC):
             TimeoutError: If tests don't complete within timeout
 
         """
-        deadline = asyncio.get_event_loop().time() + timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
 
         while True:
             if (results := await self.poll_status(dispatch_state)) is not None:
                 return results
 
-            if asyncio.get_event_loop().time() >= deadline:
+            if (remaining := deadline - loop.time()) <= 0:
                 raise TimeoutError(f"Tests did not complete within {timeout} seconds")
 
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(min(poll_interval, remaining))
@@ -1,6 +1,5 @@
 """Bitbucket Pipelines provider implementation."""
 
-import json
 import logging
 from collections.abc import AsyncGenerator, Mapping, Sequence
 from contextlib import asynccontextmanager
@@ -78,16 +77,11 @@ class BitbucketProvider(PipelineProvider[DispatchState]):
         registry_repo: str,
     ) -> DispatchState:
         """Dispatch pipeline and return state for polling."""
-        matrix_entries = [
-            entry.model_dump(mode="json")
-            for entry in test_definition.to_matrix_entries()
-        ]
-
         variables = [
             {"key": "SCANNER_ID", "value": scanner_id},
             {"key": "REGISTRY_REF", "value": registry_ref},
             {"key": "REGISTRY_REPO", "value": registry_repo},
-            {"key": "MATRIX_TESTS", "value": json.dumps(matrix_entries)},
+            {"key": "MATRIX_TESTS", "value": test_definition.to_matrix_json()},
         ]
 
         url = f"repositories/{self.config.workspace}/{self.config.repo_slug}/pipelines/"
@@ -1,6 +1,5 @@
 """GitHub Actions provider implementation."""
 
-import json
 import logging
 import uuid
 from collections.abc import AsyncGenerator, Mapping, Sequence
@@ -83,11 +82,6 @@ class GitHubActionsProvider(PipelineProvider[DispatchState]):
             dispatch_id = str(uuid.uuid4())
         dispatch_time = datetime.now(timezone.utc)
 
-        matrix_entries = [
-            entry.model_dump(mode="json")
-            for entry in test_definition.to_matrix_entries()
-        ]
-
         url = (
             f"/repos/{self.config.owner}/{self.config.repo}"
             f"/actions/workflows/{self.config.workflow_id}/dispatches"
@@ -99,7 +93,7 @@ class GitHubActionsProvider(PipelineProvider[DispatchState]):
                 "scanner_id": scanner_id,
                 "registry_ref": registry_ref,
                 "registry_repo": registry_repo,
-                "matrix": json.dumps(matrix_entries),
+                "matrix": test_definition.to_matrix_json(),
             },
         }
 
@@ -1,6 +1,5 @@
 """GitLab CI provider implementation."""
 
-import json
 import logging
 from collections.abc import AsyncGenerator, Mapping, Sequence
 from contextlib import asynccontextmanager
@@ -71,11 +70,6 @@ class GitLabCIProvider(PipelineProvider[str]):
         registry_repo: str,
     ) -> str:
         """Dispatch pipeline using Pipeline Trigger Token and return pipeline ID."""
-        matrix_entries = [
-            entry.model_dump(mode="json")
-            for entry in test_definition.to_matrix_entries()
-        ]
-
         url = f"projects/{self.encoded_project_id}/trigger/pipeline"
         payload = {
             "ref": self.config.ref,
@@ -84,7 +78,7 @@ class GitLabCIProvider(PipelineProvider[str]):
                 "SCANNER_ID": scanner_id,
                 "REGISTRY_REF": registry_ref,
                 "REGISTRY_REPO": registry_repo,
-                "MATRIX_TESTS": json.dumps(matrix_entries),
+                "MATRIX_TESTS": test_definition.to_matrix_json(),
             },
         }
 
@@ -1,6 +1,8 @@
 """Loading of providers from entry points."""
 
-from importlib.metadata import entry_points
+from collections.abc import Mapping
+from functools import cache
+from importlib.metadata import EntryPoint, entry_points
 from typing import Any
 
 from scan_test_action.providers.manifest import ProviderManifest
@@ -12,8 +14,15 @@ class ProviderNotFoundError(Exception):
     """Raised when a provider is not found."""
 
 
+@cache
+def provider_entry_points() -> Mapping[str, EntryPoint]:
+    """Index the registered provider entry points by key, once per process."""
+    return {entry.name: entry for entry in entry_points(group=ENTRY_POINT_GROUP)}
+
+
+@cache
 def load_provider_manifest(key: str) -> ProviderManifest[Any, Any]:
-    """Load a provider manifest by key.
+    """Load a provider manifest by key, once per key and process.
 
     Args:
         key: The provider key as registered in pyproject.toml
@@ -26,14 +35,14 @@ def load_provider_manifest(key: str) -> ProviderManifest[Any, Any]:
         ProviderNotFoundError: If no provider with the given key is found
 
     """
-    entries = entry_points(group=ENTRY_POINT_GROUP)
+    entries = provider_entry_points()
 
-    for entry in entries:
-        if entry.name == key:
-            manifest: ProviderManifest[Any, Any] = entry.load()
-            return manifest
+    try:
+        entry = entries[key]
+    except KeyError:
+        raise ProviderNotFoundError(
+            f"Provider '{key}' not found. Available providers: {sorted(entries)}"
+        ) from None
 
-    available = [e.name for e in entries]
-    raise ProviderNotFoundError(
-        f"Provider '{key}' not found. Available providers: {available}"
-    )
+    manifest: ProviderManifest[Any, Any] = entry.load()
+    return manifest
@@ -2,11 +2,17 @@
 
 import asyncio
 import logging
+import os
 from collections.abc import Sequence
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+GIT_ENV_OVERRIDES = {
+    "GIT_OPTIONAL_LOCKS": "0",
+    "GIT_PAGER": "cat",
+}
+
 
 async def get_scanners_to_test(
     registry_path: Path,
@@ -71,6 +77,7 @@ async def get_changed_files(
         resolved_base,
         resolved_head,
         cwd=registry_path,
+        env={**os.environ, **GIT_ENV_OVERRIDES},
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
     )
@@ -89,31 +96,50 @@ async def resolve_ref(registry_path: Path, ref: str) -> str:
     In CI environments like GitHub Actions, refs often exist as origin/main
     instead of main. This function tries both.
     """
-    if await ref_exists(registry_path, ref):
-        return ref
-
+    candidates = [ref]
     if not ref.startswith(("origin/", "refs/")):
-        origin_ref = f"origin/{ref}"
-        if await ref_exists(registry_path, origin_ref):
-            return origin_ref
+        candidates.append(f"origin/{ref}")
+
+    for candidate, exists in zip(
+        candidates, await refs_exist(registry_path, candidates), strict=True
+    ):
+        if exists:
+            return candidate
 
     raise RuntimeError(f"Cannot resolve git ref '{ref}'")
 
 
 async def ref_exists(registry_path: Path, ref: str) -> bool:
     """Check if a git reference exists."""
+    (exists,) = await refs_exist(registry_path, [ref])
+    return exists
+
+
+async def refs_exist(registry_path: Path, refs: Sequence[str]) -> Sequence[bool]:
+    """Check which git references exist using a single git process.
+
+    Refs are fed to one `git cat-file --batch-check` process instead of
+    spawning a `git rev-parse` per ref.
+    """
     process = await asyncio.create_subprocess_exec(
         "git",
-        "rev-parse",
-        "--verify",
-        "--quiet",
-        ref,
+        "cat-file",
+        "--batch-check=%(objectname)",
         cwd=registry_path,
-        stdout=asyncio.subprocess.DEVNULL,
+        env={**os.environ, **GIT_ENV_OVERRIDES},
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.DEVNULL,
     )
-    await process.communicate()
-    return process.returncode == 0
+    stdout, _ = await process.communicate("".join(f"{r}\n" for r in refs).encode())
+
+    if process.returncode != 0:
+        return [False] * len(refs)
+
+    return [
+        not line.endswith((" missing", " ambiguous"))
+        for line in stdout.decode().splitlines()
+    ]
 
 
 def extract_scanner_ids(changed_files: Sequence[str]) -> Sequence[str]:
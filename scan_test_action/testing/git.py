@@ -0,0 +1,35 @@
+"""Git helpers for tests that build throwaway repositories."""
+
+import os
+import subprocess
+from pathlib import Path
+
+# Pin commit dates and ignore host git config and hooks so helper commits are
+# cheap and reproducible
+GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_DATE": "2020-01-01T00:00:00Z",
+    "GIT_COMMITTER_DATE": "2020-01-01T00:00:00Z",
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_SYSTEM": os.devnull,
+}
+
+
+def commit_all(repo: Path, message: str, *, allow_empty: bool = False) -> str:
+    """Commit all changes in the repository and return the commit SHA.
+
+    Staging, committing and resolving HEAD share a single shell process.
+    """
+    empty = " --allow-empty" if allow_empty else ""
+    script = (
+        f'git add -A && git commit -q --no-verify{empty} -m "$1" && git rev-parse HEAD'
+    )
+    result = subprocess.run(
+        ["sh", "-c", script, "sh", message],
+        cwd=repo,
+        env=GIT_ENV,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip()
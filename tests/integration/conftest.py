@@ -1,13 +1,18 @@
 """Fixtures for integration tests."""
 
+import os
+import shutil
 import subprocess
 from collections.abc import AsyncGenerator
 from pathlib import Path
 from typing import Protocol
 
 import pytest
+import pytest_asyncio
 from aioresponses import aioresponses as aioresponses_cls
 
+from scan_test_action.testing.git import GIT_ENV, commit_all
+
 
 class CommitFn(Protocol):
     """Protocol for git commit function."""
@@ -23,28 +28,49 @@ class CreateScannerFn(Protocol):
         """Create a scanner directory and return its path."""
 
 
-@pytest.fixture
-def git_repo(tmp_path: Path) -> Path:
-    """Create an initialized git repository."""
+GIT_REPO_CONFIG = {
+    "user.email": "test@example.com",
+    "user.name": "Test",
+    "gc.auto": "0",
+    "core.untrackedCache": "true",
+    "core.fsmonitor": "false",
+}
+
+
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a configured git repository to copy into each test."""
+    template = tmp_path_factory.mktemp("git-template")
     subprocess.run(
         ["git", "init"],
-        cwd=tmp_path,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=tmp_path,
+        cwd=template,
+        env=GIT_ENV,
         check=True,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=tmp_path,
-        check=True,
-        capture_output=True,
-    )
-    return tmp_path
+    for key, value in GIT_REPO_CONFIG.items():
+        subprocess.run(
+            ["git", "config", key, value],
+            cwd=template,
+            env=GIT_ENV,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    return template
+
+
+@pytest.fixture
+def git_repo(git_template: Path, tmp_path: Path) -> Path:
+    """Create an initialized git repository.
+
+    Files are hard-linked from the session template; git replaces files by
+    rename when writing, so the template is never modified through the links.
+    """
+    repo = tmp_path / "repo"
+    shutil.copytree(git_template, repo, copy_function=os.link)
+    return repo
 
 
 @pytest.fixture
@@ -52,26 +78,7 @@ def git_commit(git_repo: Path) -> CommitFn:
     """Return a function to create commits in the test repo."""
 
     def _commit(message: str) -> str:
-        subprocess.run(
-            ["git", "add", "-A"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "commit", "--allow-empty", "-m", message],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-        )
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        return result.stdout.strip()
+        return commit_all(git_repo, message, allow_empty=True)
 
     return _commit
 
@@ -91,7 +98,7 @@ def create_scanner(git_repo: Path) -> CreateScannerFn:
     return _create
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def aioresponses() -> AsyncGenerator[aioresponses_cls, None]:
     """Provide aioresponses mock for HTTP calls."""
     with aioresponses_cls() as mocker:
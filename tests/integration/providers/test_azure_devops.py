@@ -1,8 +1,10 @@
 """Integration tests for Azure DevOps provider."""
 
+import json
 from collections.abc import AsyncGenerator
 
 import pytest
+import pytest_asyncio
 from aioresponses import aioresponses as aioresponses_cls
 from pydantic import SecretStr
 from yarl import URL
@@ -33,7 +35,7 @@ def config() -> AzureDevOpsConfig:
     )
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def provider(
     config: AzureDevOpsConfig, aioresponses: aioresponses_cls
 ) -> AsyncGenerator[AzureDevOpsProvider, None]:
@@ -139,8 +141,6 @@ class TestDispatchScannerTests:
 
         call = aioresponses.requests[("POST", URL(dispatch_url))][0]
         payload = call.kwargs["json"]
-        import json
-
         matrix = json.loads(payload["templateParameters"]["MATRIX_TESTS"])
         assert len(matrix) == 3
         assert matrix[0] == {
@@ -1,8 +1,10 @@
 """Integration tests for Bitbucket Pipelines provider."""
 
+import json
 from collections.abc import AsyncGenerator
 
 import pytest
+import pytest_asyncio
 from aioresponses import aioresponses as aioresponses_cls
 from pydantic import SecretStr
 from yarl import URL
@@ -32,7 +34,7 @@ def config() -> BitbucketConfig:
     )
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def provider(
     config: BitbucketConfig, aioresponses: aioresponses_cls
 ) -> AsyncGenerator[BitbucketProvider, None]:
@@ -140,8 +142,6 @@ class TestDispatchScannerTests:
         call = aioresponses.requests[("POST", URL(dispatch_url))][0]
         payload = call.kwargs["json"]
         variables = {v["key"]: v["value"] for v in payload["variables"]}
-        import json
-
         matrix = json.loads(variables["MATRIX_TESTS"])
         assert len(matrix) == 3
         assert matrix[0] == {
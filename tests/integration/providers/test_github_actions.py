@@ -1,10 +1,12 @@
 """Integration tests for GitHub Actions provider."""
 
+import json
 import re
 from collections.abc import AsyncGenerator
 from datetime import datetime, timezone
 
 import pytest
+import pytest_asyncio
 from aioresponses import aioresponses as aioresponses_cls
 from pydantic import SecretStr
 from yarl import URL
@@ -39,7 +41,7 @@ def config() -> GitHubActionsConfig:
     )
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def provider(
     config: GitHubActionsConfig, aioresponses: aioresponses_cls
 ) -> AsyncGenerator[GitHubActionsProvider, None]:
@@ -135,8 +137,6 @@ class TestDispatchScannerTests:
 
         call = aioresponses.requests[("POST", URL(dispatch_url))][0]
         payload = call.kwargs["json"]
-        import json
-
         matrix = json.loads(payload["inputs"]["matrix"])
         assert len(matrix) == 3
         assert matrix[0] == {
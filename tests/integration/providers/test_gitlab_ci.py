@@ -1,8 +1,10 @@
 """Integration tests for GitLab CI provider."""
 
+import json
 from collections.abc import AsyncGenerator
 
 import pytest
+import pytest_asyncio
 from aioresponses import aioresponses as aioresponses_cls
 from pydantic import SecretStr
 from yarl import URL
@@ -19,20 +21,56 @@ from scan_test_action.testing.gitlab.payloads import (
 )
 
 API_BASE_URL = "http://gitlab.test/api/v4/"
+DISPATCH_URL = f"{API_BASE_URL}projects/12345/trigger/pipeline"
+PIPELINE_789_URL = f"{API_BASE_URL}projects/12345/pipelines/789"
+DISPATCH_URL_OBJ = URL(DISPATCH_URL)
+PIPELINE_789_URL_OBJ = URL(PIPELINE_789_URL)
+
+BASE_PIPELINE = pipeline()
+CREATE_PIPELINE_789_RESPONSE = create_pipeline_response(pipeline_id=789)
+
+EXPECTED_MATRIX = (
+    {
+        "test_name": "source scan",
+        "test_type": "source-code",
+        "source_url": "https://github.com/org/repo1.git",
+        "source_ref": "main",
+        "scan_path": "src",
+        "timeout": "5m",
+    },
+    {
+        "test_name": "source scan",
+        "test_type": "source-code",
+        "source_url": "https://github.com/org/repo1.git",
+        "source_ref": "main",
+        "scan_path": "lib",
+        "timeout": "5m",
+    },
+    {
+        "test_name": "container scan",
+        "test_type": "container-image",
+        "source_url": "https://github.com/org/repo2.git",
+        "source_ref": "v1.0.0",
+        "scan_path": ".",
+        "timeout": "5m",
+    },
+)
+
+BASE_CONFIG = GitLabCIConfig(
+    trigger_token=SecretStr("glptt-trigger-token-123"),
+    api_token=SecretStr("glpat-api-token-456"),
+    project_id="12345",
+    api_base_url=API_BASE_URL,
+)
 
 
 @pytest.fixture
 def config() -> GitLabCIConfig:
-    """Create test configuration."""
-    return GitLabCIConfig(
-        trigger_token=SecretStr("glptt-trigger-token-123"),
-        api_token=SecretStr("glpat-api-token-456"),
-        project_id="12345",
-        api_base_url=API_BASE_URL,
-    )
+    """Provide the shared test configuration."""
+    return BASE_CONFIG
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def provider(
     config: GitLabCIConfig, aioresponses: aioresponses_cls
 ) -> AsyncGenerator[GitLabCIProvider, None]:
@@ -50,11 +88,10 @@ class TestDispatchScannerTests:
         aioresponses: aioresponses_cls,
     ) -> None:
         """Dispatches pipeline via trigger endpoint with correct API parameters."""
-        dispatch_url = f"{API_BASE_URL}projects/12345/trigger/pipeline"
         aioresponses.post(
-            dispatch_url,
+            DISPATCH_URL,
             status=201,
-            payload=create_pipeline_response(pipeline_id=789),
+            payload=CREATE_PIPELINE_789_RESPONSE,
         )
 
         test_definition = TestDefinitionFactory.build(
@@ -77,7 +114,7 @@ class TestDispatchScannerTests:
         assert pipeline_id == "789"
 
         aioresponses.assert_called_once()  # type: ignore[no-untyped-call]
-        call = aioresponses.requests[("POST", URL(dispatch_url))][0]
+        call = aioresponses.requests[("POST", DISPATCH_URL_OBJ)][0]
         payload = call.kwargs["json"]
         assert payload["ref"] == "main"
         assert payload["token"] == "glptt-trigger-token-123"
@@ -91,11 +128,10 @@ class TestDispatchScannerTests:
         aioresponses: aioresponses_cls,
     ) -> None:
         """Dispatches pipeline with multiple tests and scan paths in matrix."""
-        dispatch_url = f"{API_BASE_URL}projects/12345/trigger/pipeline"
         aioresponses.post(
-            dispatch_url,
+            DISPATCH_URL,
             status=201,
-            payload=create_pipeline_response(pipeline_id=789),
+            payload=CREATE_PIPELINE_789_RESPONSE,
         )
 
         test_definition = TestDefinitionFactory.build(
@@ -130,36 +166,10 @@ class TestDispatchScannerTests:
             registry_repo="org/registry",
         )
 
-        call = aioresponses.requests[("POST", URL(dispatch_url))][0]
+        call = aioresponses.requests[("POST", DISPATCH_URL_OBJ)][0]
         payload = call.kwargs["json"]
-        import json
-
         matrix = json.loads(payload["variables"]["MATRIX_TESTS"])
-        assert len(matrix) == 3
-        assert matrix[0] == {
-            "test_name": "source scan",
-            "test_type": "source-code",
-            "source_url": "https://github.com/org/repo1.git",
-            "source_ref": "main",
-            "scan_path": "src",
-            "timeout": "5m",
-        }
-        assert matrix[1] == {
-            "test_name": "source scan",
-            "test_type": "source-code",
-            "source_url": "https://github.com/org/repo1.git",
-            "source_ref": "main",
-            "scan_path": "lib",
-            "timeout": "5m",
-        }
-        assert matrix[2] == {
-            "test_name": "container scan",
-            "test_type": "container-image",
-            "source_url": "https://github.com/org/repo2.git",
-            "source_ref": "v1.0.0",
-            "scan_path": ".",
-            "timeout": "5m",
-        }
+        assert tuple(matrix) == EXPECTED_MATRIX
 
     async def test_raises_on_dispatch_failure(
         self,
@@ -168,7 +178,7 @@ class TestDispatchScannerTests:
     ) -> None:
         """Raises RuntimeError when dispatch fails."""
         aioresponses.post(
-            f"{API_BASE_URL}projects/12345/trigger/pipeline",
+            DISPATCH_URL,
             status=400,
             body="Bad Request",
         )
@@ -192,7 +202,7 @@ class TestDispatchScannerTests:
     ) -> None:
         """Raises RuntimeError when pipeline ID is missing from response."""
         aioresponses.post(
-            f"{API_BASE_URL}projects/12345/trigger/pipeline",
+            DISPATCH_URL,
             status=201,
             payload={"web_url": "https://gitlab.com/project/pipelines/789"},
         )
@@ -220,8 +230,8 @@ class TestPollStatus:
     ) -> None:
         """Returns None when pipeline is still running."""
         aioresponses.get(
-            f"{API_BASE_URL}projects/12345/pipelines/789",
-            payload=pipeline(status="running"),
+            PIPELINE_789_URL,
+            payload={**BASE_PIPELINE, "status": "running"},
         )
 
         result = await provider.poll_status("789")
@@ -235,8 +245,8 @@ class TestPollStatus:
     ) -> None:
         """Returns None when pipeline is pending."""
         aioresponses.get(
-            f"{API_BASE_URL}projects/12345/pipelines/789",
-            payload=pipeline(status="pending"),
+            PIPELINE_789_URL,
+            payload={**BASE_PIPELINE, "status": "pending"},
         )
 
         result = await provider.poll_status("789")
@@ -250,7 +260,7 @@ class TestPollStatus:
     ) -> None:
         """Returns results when pipeline completes successfully."""
         aioresponses.get(
-            f"{API_BASE_URL}projects/12345/pipelines/789",
+            PIPELINE_789_URL,
             payload=pipeline(
                 pipeline_id=789,
                 status="success",
@@ -287,8 +297,8 @@ class TestPollStatus:
     ) -> None:
         """Maps GitLab pipeline status to test result status."""
         aioresponses.get(
-            f"{API_BASE_URL}projects/12345/pipelines/789",
-            payload=pipeline(status=gitlab_status),
+            PIPELINE_789_URL,
+            payload={**BASE_PIPELINE, "status": gitlab_status},
         )
 
         results = await provider.poll_status("789")
@@ -303,7 +313,7 @@ class TestPollStatus:
     ) -> None:
         """Raises RuntimeError on API failure."""
         aioresponses.get(
-            f"{API_BASE_URL}projects/12345/pipelines/789",
+            PIPELINE_789_URL,
             status=404,
             body="Not Found",
         )
@@ -321,9 +331,8 @@ class TestGetPipeline:
         aioresponses: aioresponses_cls,
     ) -> None:
         """Returns pipeline model from API response with Bearer token auth."""
-        get_url = f"{API_BASE_URL}projects/12345/pipelines/789"
         aioresponses.get(
-            get_url,
+            PIPELINE_789_URL,
             payload=pipeline(pipeline_id=789, ref="feature-branch"),
         )
 
@@ -333,7 +342,7 @@ class TestGetPipeline:
         assert result.ref == "feature-branch"
         assert result.status == "success"
 
-        call = aioresponses.requests[("GET", URL(get_url))][0]
+        call = aioresponses.requests[("GET", PIPELINE_789_URL_OBJ)][0]
         assert call.kwargs["headers"]["Authorization"] == "Bearer glpat-api-token-456"
 
 
@@ -345,11 +354,8 @@ class TestProjectIdEncoding:
         aioresponses: aioresponses_cls,
     ) -> None:
         """URL-encodes project path for API calls."""
-        config = GitLabCIConfig(
-            trigger_token=SecretStr("glptt-trigger-token-123"),
-            api_token=SecretStr("glpat-api-token-456"),
-            project_id="boostsecurityio/martin/test-runner",
-            api_base_url=API_BASE_URL,
+        config = BASE_CONFIG.model_copy(
+            update={"project_id": "boostsecurityio/martin/test-runner"}
         )
 
         async with GitLabCIProvider.from_config(config) as provider:
@@ -360,7 +366,7 @@ class TestProjectIdEncoding:
             aioresponses.post(
                 encoded_url,
                 status=201,
-                payload=create_pipeline_response(pipeline_id=789),
+                payload=CREATE_PIPELINE_789_RESPONSE,
             )
 
             test_definition = TestDefinitionFactory.build(
@@ -12,8 +12,10 @@ from scan_test_action.scanner_detector import (
     has_test_definition,
     has_workflow_changes,
     ref_exists,
+    refs_exist,
     resolve_ref,
 )
+from scan_test_action.testing.git import GIT_ENV
 
 from .conftest import CommitFn, CreateScannerFn
 
@@ -231,25 +233,19 @@ class TestGetScannersToTest:
 class TestHasTestDefinition:
     """Tests for has_test_definition."""
 
-    def test_returns_true_when_exists(
-        self,
-        git_repo: Path,
-        create_scanner: CreateScannerFn,
-    ) -> None:
+    def test_returns_true_when_exists(self, tmp_path: Path) -> None:
         """Returns True when tests.yaml exists."""
-        create_scanner("org/scanner", with_tests=True)
+        scanner_dir = tmp_path / "scanners" / "org" / "scanner"
+        scanner_dir.mkdir(parents=True)
+        (scanner_dir / "tests.yaml").touch()
 
-        assert has_test_definition(git_repo, "org/scanner") is True
+        assert has_test_definition(tmp_path, "org/scanner") is True
 
-    def test_returns_false_when_missing(
-        self,
-        git_repo: Path,
-        create_scanner: CreateScannerFn,
-    ) -> None:
+    def test_returns_false_when_missing(self, tmp_path: Path) -> None:
         """Returns False when tests.yaml doesn't exist."""
-        create_scanner("org/scanner", with_tests=False)
+        (tmp_path / "scanners" / "org" / "scanner").mkdir(parents=True)
 
-        assert has_test_definition(git_repo, "org/scanner") is False
+        assert has_test_definition(tmp_path, "org/scanner") is False
 
 
 class TestGetChangedFiles:
@@ -303,10 +299,11 @@ class TestGetChangedFiles:
         git_commit("initial")
 
         # Create a ref pointing to a blob (not a commit)
-        # git rev-parse --verify will accept it, but git diff will fail
+        # git cat-file will resolve it, but git diff will fail
         result = subprocess.run(
             ["git", "hash-object", "-w", "--stdin"],
             cwd=git_repo,
+            env=GIT_ENV,
             input="test content",
             capture_output=True,
             text=True,
@@ -317,6 +314,7 @@ class TestGetChangedFiles:
         subprocess.run(
             ["git", "update-ref", "refs/blob-ref", blob_sha],
             cwd=git_repo,
+            env=GIT_ENV,
             check=True,
             capture_output=True,
         )
@@ -365,6 +363,7 @@ class TestResolveRef:
         subprocess.run(
             ["git", "update-ref", "refs/remotes/origin/test-branch", "HEAD"],
             cwd=git_repo,
+            env=GIT_ENV,
             check=True,
             capture_output=True,
         )
@@ -390,6 +389,26 @@ class TestRefExists:
         assert await ref_exists(git_repo, "non-existent") is False
 
 
+class TestRefsExist:
+    """Tests for refs_exist."""
+
+    async def test_checks_multiple_refs(
+        self, git_repo: Path, git_commit: CommitFn
+    ) -> None:
+        """Returns existence of each ref in input order."""
+        sha = git_commit("initial")
+
+        result = await refs_exist(git_repo, ["HEAD", "non-existent", sha])
+
+        assert result == [True, False, True]
+
+    async def test_returns_false_outside_repository(self, tmp_path: Path) -> None:
+        """Returns False for every ref when the path is not a git repository."""
+        result = await refs_exist(tmp_path, ["HEAD", "main"])
+
+        assert result == [False, False]
+
+
 class TestExtractScannerIds:
     """Tests for extract_scanner_ids."""
 
@@ -1,15 +1,84 @@
 """Fixtures for module tests using WireMock testcontainers."""
 
+import os
+import platform
+import shutil
 import subprocess
+import threading
+from collections import deque
 from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Protocol
 
 import pytest
 from testcontainers.core import testcontainers_config
 from testcontainers.core.network import Network
+from wiremock.client import (
+    HttpMethods,
+    Mapping,
+    MappingRequest,
+    MappingResponse,
+    Mappings,
+)
 from wiremock.constants import Config
 from wiremock.testing.testcontainer import WireMockContainer
 
+from scan_test_action.testing.azure import payloads as azure_payloads
+from scan_test_action.testing.bitbucket import payloads as bitbucket_payloads
+from scan_test_action.testing.git import GIT_ENV, commit_all
+from scan_test_action.testing.github import payloads as github_payloads
+from scan_test_action.testing.gitlab import payloads as gitlab_payloads
+
+ACT_RUNNER_IMAGE = "catthehacker/ubuntu:act-latest"
+# Suffixed with the pytest-xdist worker ID so reused job containers are never
+# shared between parallel workers
+ACT_WORKFLOW_NAME = f"Test Scanner {os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
+# act names job containers and their volumes after the workflow, with spaces
+# replaced by dashes
+ACT_CONTAINER_PREFIX = f"act-{ACT_WORKFLOW_NAME.replace(' ', '-')}-"
+ACTION_PATH = Path(__file__).parent.parent.parent.resolve()
+# Run the job natively; forcing amd64 on arm64 hosts runs it under QEMU
+ACT_CONTAINER_ARCHITECTURE = (
+    "linux/arm64" if platform.machine() in ("aarch64", "arm64") else "linux/amd64"
+)
+ACT_TIMEOUT = 60
+ACT_OUTPUT_LINES = 500
+
+
+class CommitFn(Protocol):
+    """Protocol for git commit function."""
+
+    def __call__(self, message: str) -> str:
+        """Commit all changes and return the commit SHA."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class GoldenRegistry:
+    """Session-wide registry repository with its known commits."""
+
+    path: Path
+    base_commit: str
+    head_commit: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class ActResult:
+    """Exit code and the tail of the combined act output."""
+
+    returncode: int
+    output: str
+
+
+class RunActFn(Protocol):
+    """Protocol for act runner function."""
+
+    def __call__(
+        self, registry_path: Path, head_commit: str, *extra_args: str
+    ) -> ActResult:
+        """Run the `test` job of the registry workflows with act."""
+
 
 @pytest.fixture(scope="session", autouse=True)
 def _disable_ryuk() -> None:
@@ -26,25 +95,41 @@ def docker_network() -> Generator[Network]:
 
 @pytest.fixture(scope="session")
 def wiremock_server_name() -> str:
-    """Define a name for the container in the docker DNS."""
-    return "wiremock"
+    """Define a name for the container in the docker DNS.
 
+    Suffixed with the pytest-xdist worker ID so parallel workers each start
+    their own container.
+    """
+    return f"wiremock-{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
 
-@pytest.fixture(scope="session")
-def wiremock_server(
+
+@pytest.fixture(scope="session", autouse=True)
+def wiremock_startup(
     docker_network: Network, wiremock_server_name: str
-) -> Generator[WireMockContainer, None, None]:
-    """Start WireMock container using wiremock's testcontainer support."""
+) -> Generator[Future[WireMockContainer]]:
+    """Start WireMock in the background so it overlaps with registry setup."""
     container = (
         WireMockContainer(secure=False)
         .with_network(docker_network)
-        .with_name("wiremock")
+        .with_name(wiremock_server_name)
     )
 
-    with container as wm:
-        Config.base_url = wm.get_url("__admin")
-        yield wm
-        print(wm.get_logs())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        startup = executor.submit(container.start)
+        yield startup
+
+    startup.result().stop()
+
+
+@pytest.fixture(scope="session")
+def wiremock_server(
+    wiremock_startup: Future[WireMockContainer],
+) -> Generator[WireMockContainer, None, None]:
+    """Wait for the WireMock container started by wiremock_startup."""
+    wm = wiremock_startup.result()
+    Config.base_url = wm.get_url("__admin")
+    yield wm
+    print(wm.get_logs())
 
 
 @pytest.fixture(scope="session")
@@ -53,65 +138,338 @@ def wiremock_url(wiremock_server_name: str) -> str:
     return f"http://{wiremock_server_name}:8080"
 
 
-@pytest.fixture
-def registry_path(tmp_path: Path) -> Path:
-    """Create an isolated git repository for each test."""
-    subprocess.run(
-        ["git", "init"],
-        cwd=tmp_path,
-        check=True,
-        capture_output=True,
+@pytest.fixture(scope="session")
+def wiremock_host_url(wiremock_server: WireMockContainer) -> str:
+    """URL for WireMock from the host, for tests that run the CLI in-process."""
+    return wiremock_server.get_base_url()
+
+
+@pytest.fixture(scope="session")
+def wiremock_mappings(wiremock_server: WireMockContainer) -> None:
+    """Register the mock API of every provider once per session.
+
+    Providers use disjoint URL paths, so all mappings can coexist.
+    """
+    Mappings.delete_all_mappings()
+
+    # Azure DevOps: pipeline dispatch (POST)
+    Mappings.create_mapping(
+        Mapping(
+            request=MappingRequest(
+                method=HttpMethods.POST,
+                url_path_pattern="/test-org/test-project/_apis/pipelines/.*/runs.*",
+            ),
+            response=MappingResponse(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                json_body=azure_payloads.create_run_response(run_id=999),
+            ),
+        )
     )
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=tmp_path,
-        check=True,
-        capture_output=True,
+
+    # Azure DevOps: pipeline run status (GET) - returns completed run
+    Mappings.create_mapping(
+        Mapping(
+            request=MappingRequest(
+                method=HttpMethods.GET,
+                url_path_pattern="/test-org/test-project/_apis/pipelines/.*/runs/.*",
+            ),
+            response=MappingResponse(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                json_body=azure_payloads.pipeline_run(
+                    run_id=999,
+                    state="completed",
+                    result="succeeded",
+                    created_date="2099-01-01T12:00:00Z",
+                    finished_date="2099-01-01T12:01:30Z",
+                ),
+            ),
+        )
     )
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=tmp_path,
-        check=True,
-        capture_output=True,
+
+    bitbucket_run_url = (
+        "https://bitbucket.org/test-workspace/test-repo/pipelines/results/42"
     )
 
-    return tmp_path
+    # Bitbucket: pipeline dispatch (POST)
+    Mappings.create_mapping(
+        Mapping(
+            request=MappingRequest(
+                method=HttpMethods.POST,
+                url_path_pattern="/2.0/repositories/.*/pipelines/",
+            ),
+            response=MappingResponse(
+                status=201,
+                headers={
+                    "Content-Type": "application/json",
+                    "Location": bitbucket_run_url,
+                },
+                json_body=bitbucket_payloads.create_pipeline_response(
+                    uuid="{abc-123-def}"
+                ),
+            ),
+        )
+    )
 
+    # Bitbucket: pipeline status (GET) - returns completed pipeline
+    Mappings.create_mapping(
+        Mapping(
+            request=MappingRequest(
+                method=HttpMethods.GET,
+                url_path_pattern="/2.0/repositories/.*/pipelines/.*",
+            ),
+            response=MappingResponse(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                json_body=bitbucket_payloads.pipeline(
+                    uuid="{abc-123-def}",
+                    state_name="COMPLETED",
+                    result_name="SUCCESSFUL",
+                    created_on="2099-01-01T12:00:00.000000+00:00",
+                    completed_on="2099-01-01T12:01:30.000000+00:00",
+                ),
+            ),
+        )
+    )
 
-@pytest.fixture
-def base_commit(registry_path: Path) -> str:
-    """Create initial commit (base ref for comparison)."""
-    readme = registry_path / "README.md"
-    readme.write_text("# Scanner Registry\n")
+    # GitHub Actions: workflow dispatch (POST)
+    Mappings.create_mapping(
+        Mapping(
+            request=MappingRequest(
+                method=HttpMethods.POST,
+                url_path_pattern="/repos/.*/actions/workflows/.*/dispatches",
+            ),
+            response=MappingResponse(
+                status=204,
+                headers={"Content-Type": "application/json"},
+            ),
+        )
+    )
 
-    subprocess.run(
-        ["git", "add", "-A"],
-        cwd=registry_path,
-        check=True,
-        capture_output=True,
+    # GitHub Actions: workflow runs list (GET) - completed run with static dispatch_id
+    Mappings.create_mapping(
+        Mapping(
+            request=MappingRequest(
+                method=HttpMethods.GET,
+                url_path_pattern="/repos/.*/actions/runs.*",
+            ),
+            response=MappingResponse(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                json_body=github_payloads.workflow_runs_response(
+                    workflow_runs=[
+                        github_payloads.workflow_run(
+                            run_id=123,
+                            display_title="[static-dispatch-id]",
+                            status="completed",
+                            conclusion="success",
+                            html_url="https://github.com/test/runs/123",
+                            created_at="2099-01-01T12:00:00Z",
+                            updated_at="2099-01-01T12:01:30Z",
+                        )
+                    ]
+                ),
+            ),
+        )
     )
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=registry_path,
-        check=True,
-        capture_output=True,
+
+    # GitLab CI: pipeline dispatch via trigger endpoint (POST)
+    Mappings.create_mapping(
+        Mapping(
+            request=MappingRequest(
+                method=HttpMethods.POST,
+                url_path_pattern="/api/v4/projects/.*/trigger/pipeline",
+            ),
+            response=MappingResponse(
+                status=201,
+                headers={"Content-Type": "application/json"},
+                json_body=gitlab_payloads.create_pipeline_response(pipeline_id=789),
+            ),
+        )
+    )
+
+    # GitLab CI: pipeline status (GET) - returns completed pipeline
+    Mappings.create_mapping(
+        Mapping(
+            request=MappingRequest(
+                method=HttpMethods.GET,
+                url_path_pattern="/api/v4/projects/.*/pipelines/.*",
+            ),
+            response=MappingResponse(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                json_body=gitlab_payloads.pipeline(
+                    pipeline_id=789,
+                    status="success",
+                    web_url="https://gitlab.com/test/project/-/pipelines/789",
+                    created_at="2099-01-01T12:00:00Z",
+                    updated_at="2099-01-01T12:01:30Z",
+                ),
+            ),
+        )
     )
-    result = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
-        cwd=registry_path,
+
+
+@pytest.fixture(scope="session")
+def act_cache_dir() -> Path:
+    """Directory where act caches remote actions such as actions/checkout.
+
+    Defaults to act's own cache location so it persists across sessions and
+    can be restored by CI; override with ACT_CACHE_DIR.
+    """
+    cache_dir = Path(os.environ.get("ACT_CACHE_DIR", Path.home() / ".cache" / "act"))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+@pytest.fixture(scope="session", autouse=True)
+def act_image_pull() -> Generator[Future[subprocess.CompletedProcess[bytes]]]:
+    """Pull the act runner image in the background at session start.
+
+    The pull overlaps with WireMock startup and registry setup instead of
+    blocking the first act test.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pull = executor.submit(
+            subprocess.run,
+            ["docker", "pull", ACT_RUNNER_IMAGE],
+            check=True,
+            capture_output=True,
+        )
+        yield pull
+
+
+@pytest.fixture(scope="session")
+def action_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Copy only what the action needs to run, once per session.
+
+    act copies the local action into the job container on every run, so
+    tests, virtualenvs and caches are left out.
+    """
+    path = tmp_path_factory.mktemp("action") / "scan-test-action"
+    shutil.copytree(
+        ACTION_PATH,
+        path,
+        ignore=shutil.ignore_patterns(
+            ".git",
+            ".venv",
+            "tests",
+            "__pycache__",
+            "*.pyc",
+            ".*_cache",
+            "htmlcov",
+            ".coverage",
+        ),
+    )
+    return path
+
+
+@pytest.fixture(scope="session")
+def run_act(
+    docker_network: Network,
+    act_cache_dir: Path,
+    action_path: Path,
+    act_image_pull: Future[subprocess.CompletedProcess[bytes]],
+) -> Generator[RunActFn]:
+    """Wait for the runner image and yield a function to run act.
+
+    The local action is mapped to a trimmed copy of this repository, and act
+    is told not to pull the runner image again on every invocation. Output is
+    streamed and only the last ACT_OUTPUT_LINES lines are kept. Job containers
+    and their volumes are kept with --reuse so later runs of the same workflow
+    skip container creation; this worker's are removed at the end of the
+    session.
+    """
+    act_image_pull.result()
+    base_args = [
+        "act",
+        "push",
+        "--network",
+        docker_network.name,
+        "-j",
+        "test",
+        "-P",
+        f"ubuntu-latest={ACT_RUNNER_IMAGE}",
+        "--pull=false",
+        "--reuse",
+        "--action-cache-path",
+        str(act_cache_dir),
+        "--container-architecture",
+        ACT_CONTAINER_ARCHITECTURE,
+        "--local-repository",
+        f"test-action/scan-test-action@main={action_path}",
+    ]
+
+    def _run(registry_path: Path, head_commit: str, *extra_args: str) -> ActResult:
+        with subprocess.Popen(
+            [*base_args, "--env", f"GITHUB_SHA={head_commit}", *extra_args],
+            cwd=registry_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        ) as process:
+            timer = threading.Timer(ACT_TIMEOUT, process.kill)
+            timer.start()
+            try:
+                assert process.stdout is not None
+                tail = deque(process.stdout, maxlen=ACT_OUTPUT_LINES)
+                returncode = process.wait()
+            finally:
+                timer.cancel()
+
+        return ActResult(returncode=returncode, output="".join(tail))
+
+    yield _run
+
+    # Containers first, as their volumes cannot be removed while in use
+    for kind, list_flags in (("container", "-aq"), ("volume", "-q")):
+        names = subprocess.run(
+            [
+                "docker",
+                kind,
+                "ls",
+                list_flags,
+                "--filter",
+                f"name=^{ACT_CONTAINER_PREFIX}",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        if names:
+            subprocess.run(
+                ["docker", kind, "rm", "-f", *names],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+
+
+@pytest.fixture(scope="session")
+def golden_registry(tmp_path_factory: pytest.TempPathFactory) -> GoldenRegistry:
+    """Build the registry with its base and head commits once per session."""
+    path = tmp_path_factory.mktemp("golden-registry")
+    subprocess.run(
+        [
+            "sh",
+            "-c",
+            "git init -q"
+            " && git config user.email test@example.com"
+            " && git config user.name Test",
+        ],
+        cwd=path,
+        env=GIT_ENV,
         check=True,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
-    return result.stdout.strip()
 
+    (path / "README.md").write_text("# Scanner Registry\n")
+    base_commit = commit_all(path, "Initial commit")
 
-@pytest.fixture
-def head_commit(registry_path: Path, base_commit: str) -> str:
-    """Create scanner with test definition and return head commit."""
-    scanner_dir = registry_path / "scanners" / "test-org" / "test-scanner"
+    scanner_dir = path / "scanners" / "test-org" / "test-scanner"
     scanner_dir.mkdir(parents=True, exist_ok=True)
-
     (scanner_dir / "module.yaml").write_text("name: test-scanner\n")
     (scanner_dir / "tests.yaml").write_text("""version: '1.0'
 tests:
@@ -123,24 +481,40 @@ tests:
     scan_paths:
       - "."
 """)
+    head_commit = commit_all(path, "Add test scanner")
 
-    subprocess.run(
-        ["git", "add", "-A"],
-        cwd=registry_path,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "commit", "-m", "Add test scanner"],
-        cwd=registry_path,
-        check=True,
-        capture_output=True,
-    )
-    result = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
-        cwd=registry_path,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    return result.stdout.strip()
+    return GoldenRegistry(path=path, base_commit=base_commit, head_commit=head_commit)
+
+
+@pytest.fixture
+def registry_path(golden_registry: GoldenRegistry, tmp_path: Path) -> Path:
+    """Create an isolated copy of the golden registry for each test.
+
+    Files are copied rather than hard-linked: git appends to reflogs and
+    rewrites COMMIT_EDITMSG in place, which would leak into the golden copy.
+    """
+    path = tmp_path / "registry"
+    shutil.copytree(golden_registry.path, path)
+    return path
+
+
+@pytest.fixture
+def git_commit(registry_path: Path) -> CommitFn:
+    """Return a function to commit all changes in the registry."""
+
+    def _commit(message: str) -> str:
+        return commit_all(registry_path, message)
+
+    return _commit
+
+
+@pytest.fixture
+def base_commit(golden_registry: GoldenRegistry) -> str:
+    """Return the initial commit (base ref for comparison)."""
+    return golden_registry.base_commit
+
+
+@pytest.fixture
+def head_commit(golden_registry: GoldenRegistry) -> str:
+    """Return the commit adding a scanner with a test definition."""
+    return golden_registry.head_commit
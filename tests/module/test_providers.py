@@ -0,0 +1,206 @@
+"""Module tests for providers and the GitHub Action using WireMock."""
+
+import json
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from string import Template
+from typing import Any
+
+import pytest
+
+from scan_test_action.cli import run
+
+from .conftest import ACT_WORKFLOW_NAME, CommitFn, RunActFn
+
+
+@dataclass(frozen=True, kw_only=True)
+class ProviderSpec:
+    """Provider key and its configuration pointing at a WireMock base URL."""
+
+    key: str
+    provider_config: Callable[[str], Mapping[str, Any]]
+
+
+AZURE_DEVOPS_SPEC = ProviderSpec(
+    key="azure-devops",
+    provider_config=lambda base_url: {
+        "token": "test-pat-token",
+        "organization": "test-org",
+        "project": "test-project",
+        "pipeline_id": 42,
+        "api_base_url": base_url,
+    },
+)
+BITBUCKET_SPEC = ProviderSpec(
+    key="bitbucket",
+    provider_config=lambda base_url: {
+        "token": "test-oauth-token",
+        "workspace": "test-workspace",
+        "repo_slug": "test-repo",
+        "api_base_url": f"{base_url}/2.0/",
+    },
+)
+GITHUB_ACTIONS_SPEC = ProviderSpec(
+    key="github-actions",
+    provider_config=lambda base_url: {
+        "token": "test-token",
+        "owner": "test-owner",
+        "repo": "test-repo",
+        "workflow_id": "test.yml",
+        "api_base_url": base_url,
+        "dispatch_id_mode": "static",
+    },
+)
+GITLAB_CI_SPEC = ProviderSpec(
+    key="gitlab-ci",
+    provider_config=lambda base_url: {
+        "trigger_token": "glptt-trigger-token-123",
+        "api_token": "glpat-api-token-456",
+        "project_id": "test-group/test-project",
+        "api_base_url": f"{base_url}/api/v4/",
+    },
+)
+PROVIDER_SPECS = (
+    AZURE_DEVOPS_SPEC,
+    BITBUCKET_SPEC,
+    GITHUB_ACTIONS_SPEC,
+    GITLAB_CI_SPEC,
+)
+
+# The action reference is fake; run_act maps it to the local action path.
+# All workflows share one name so act can reuse the job container.
+WORKFLOW_TEMPLATE = Template(f"""name: {ACT_WORKFLOW_NAME}
+on: push
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    steps:
+      - uses: actions/checkout@v4
+      - uses: test-action/scan-test-action@main
+        with:
+          provider: github-actions
+          provider-config: '$provider_config'
+          registry-path: '.'
+          registry-repo: 'test-org/scanner-registry'
+          base-ref: '$base_ref'
+$extra_inputs""")
+
+
+@pytest.fixture(scope="session")
+def provider_configs(wiremock_host_url: str) -> Mapping[str, str]:
+    """Serialize each provider's configuration for in-process CLI runs."""
+    return {
+        spec.key: json.dumps(spec.provider_config(wiremock_host_url))
+        for spec in PROVIDER_SPECS
+    }
+
+
+@pytest.fixture(scope="session")
+def action_provider_config(wiremock_url: str) -> str:
+    """Serialize the GitHub Actions configuration for runs inside act."""
+    return json.dumps(GITHUB_ACTIONS_SPEC.provider_config(wiremock_url))
+
+
+@pytest.mark.parametrize("spec", PROVIDER_SPECS, ids=lambda spec: spec.key)
+async def test_cli_with_provider(
+    spec: ProviderSpec,
+    registry_path: Path,
+    base_commit: str,
+    head_commit: str,
+    wiremock_mappings: None,
+    provider_configs: Mapping[str, str],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """CLI dispatches and polls the provider's pipeline."""
+    exit_code = await run(
+        provider_key=spec.key,
+        provider_config_json=provider_configs[spec.key],
+        registry_path=registry_path,
+        registry_repo="test-org/scanner-registry",
+        registry_ref=head_commit,
+        base_ref=base_commit,
+    )
+
+    output = json.loads(capsys.readouterr().out)
+    assert exit_code == 0, f"CLI failed:\n{output}"
+    assert output["total"] == 1
+    assert output["passed"] == 1
+    assert output["results"][0]["status"] == "success"
+
+
+def test_action_with_github_actions_provider(
+    registry_path: Path,
+    base_commit: str,
+    head_commit: str,
+    wiremock_mappings: None,
+    action_provider_config: str,
+    git_commit: CommitFn,
+    run_act: RunActFn,
+) -> None:
+    """Action dispatches and polls GitHub Actions workflow via provider."""
+    # Create a test workflow that uses the action
+    workflows_dir = registry_path / ".github" / "workflows"
+    workflows_dir.mkdir(parents=True, exist_ok=True)
+
+    workflow_content = WORKFLOW_TEMPLATE.substitute(
+        provider_config=action_provider_config,
+        base_ref=base_commit,
+        extra_inputs="",
+    )
+
+    (workflows_dir / "test.yml").write_text(workflow_content)
+
+    # Commit the workflow
+    git_commit("Add test workflow")
+
+    result = run_act(registry_path, head_commit)
+
+    assert result.returncode == 0, f"act failed:\n{result.output}"
+
+    # Verify test results in output
+    assert '"total": 1' in result.output, f"Expected 1 test result:\n{result.output}"
+    assert '"passed": 1' in result.output, f"Expected 1 passed test:\n{result.output}"
+    assert '"status": "success"' in result.output, (
+        f"Expected success status:\n{result.output}"
+    )
+
+
+def test_fallback_scanners_triggered_on_workflow_change(
+    registry_path: Path,
+    base_commit: str,
+    head_commit: str,
+    wiremock_mappings: None,
+    action_provider_config: str,
+    git_commit: CommitFn,
+    run_act: RunActFn,
+) -> None:
+    """Fallback scanners are tested when only workflow files change."""
+    # Create/modify workflow file only (no scanner changes)
+    workflows_dir = registry_path / ".github" / "workflows"
+    workflows_dir.mkdir(parents=True, exist_ok=True)
+
+    # Use the existing test scanner as a fallback
+    workflow_content = WORKFLOW_TEMPLATE.substitute(
+        provider_config=action_provider_config,
+        base_ref=head_commit,
+        extra_inputs="          fallback-scanners: 'test-org/test-scanner'\n",
+    )
+
+    (workflows_dir / "fallback-test.yml").write_text(workflow_content)
+
+    # Commit the workflow change
+    new_head_commit = git_commit("Add fallback test workflow")
+
+    result = run_act(
+        registry_path, new_head_commit, "-W", ".github/workflows/fallback-test.yml"
+    )
+
+    assert result.returncode == 0, f"act failed:\n{result.output}"
+
+    # Verify fallback scanner was tested
+    assert '"total": 1' in result.output, f"Expected 1 test result:\n{result.output}"
+    assert '"passed": 1' in result.output, f"Expected 1 passed test:\n{result.output}"
+    assert '"status": "success"' in result.output, (
+        f"Expected success status:\n{result.output}"
+    )
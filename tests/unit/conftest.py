@@ -0,0 +1,34 @@
+"""Fixtures for unit tests."""
+
+from pathlib import Path
+
+import pytest
+from pytest_asyncio import is_async_test
+
+from scan_test_action.models.definition import TestDefinition
+from scan_test_action.testing.github.factories import TestDefinitionFactory
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run all async unit tests in one session-scoped event loop.
+
+    Unit tests use no async fixtures, so sharing the loop is safe and avoids
+    creating and closing a loop per test.
+    """
+    unit_tests = Path(__file__).parent
+    session_loop = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if is_async_test(item) and item.path.is_relative_to(unit_tests):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def test_def() -> TestDefinition:
+    """Build a test definition once; models are frozen so tests can share it."""
+    return TestDefinitionFactory.build()
+
+
+@pytest.fixture(scope="session")
+def test_def2() -> TestDefinition:
+    """Build a second test definition for tests with several scanners."""
+    return TestDefinitionFactory.build()
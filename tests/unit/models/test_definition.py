@@ -1,13 +1,33 @@
-"""Tests for TestDefinition.to_matrix_entries method."""
+"""Tests for matrix conversion of test definitions."""
+
+import json
 
 from scan_test_action.models.definition import (
     MatrixEntry,
     Test,
     TestDefinition,
     TestSource,
+    build_matrix_entries,
 )
 
 
+def test_build_matrix_entries() -> None:
+    """Flattens tests into entries in test then scan path order."""
+    source = TestSource(url="https://github.com/org/repo.git", ref="main")
+    tests = [
+        Test(name="test1", type="source-code", source=source, scan_paths=["a", "b"]),
+        Test(name="test2", type="source-code", source=source, scan_paths=["c"]),
+    ]
+
+    entries = build_matrix_entries(tests)
+
+    assert [(e.test_name, e.scan_path) for e in entries] == [
+        ("test1", "a"),
+        ("test1", "b"),
+        ("test2", "c"),
+    ]
+
+
 def test_single_test_single_path() -> None:
     """Creates one entry for test with single scan path."""
     definition = TestDefinition(
@@ -130,3 +150,39 @@ def test_default_scan_paths() -> None:
     entries = definition.to_matrix_entries()
 
     assert entries[0].scan_path == "."
+
+
+def test_to_matrix_json() -> None:
+    """Serializes matrix entries as a JSON array."""
+    definition = TestDefinition(
+        version="1.0",
+        tests=[
+            Test(
+                name="smoke test",
+                type="source-code",
+                source=TestSource(url="https://github.com/org/repo.git", ref="main"),
+                scan_paths=["src", "lib"],
+            )
+        ],
+    )
+
+    matrix = json.loads(definition.to_matrix_json())
+
+    assert matrix == [
+        {
+            "test_name": "smoke test",
+            "test_type": "source-code",
+            "source_url": "https://github.com/org/repo.git",
+            "source_ref": "main",
+            "scan_path": "src",
+            "timeout": "5m",
+        },
+        {
+            "test_name": "smoke test",
+            "test_type": "source-code",
+            "source_url": "https://github.com/org/repo.git",
+            "source_ref": "main",
+            "scan_path": "lib",
+            "timeout": "5m",
+        },
+    ]
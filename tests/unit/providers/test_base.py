@@ -1,6 +1,8 @@
 """Tests for PipelineProvider base class."""
 
-from collections.abc import Sequence
+import asyncio
+import re
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 
 import pytest
@@ -10,13 +12,22 @@ from scan_test_action.models.result import TestResult
 from scan_test_action.providers.base import PipelineProvider
 from scan_test_action.testing.factories import TestResultFactory
 
+# Built once; no test here depends on distinct generated values
+RESULTS = (TestResultFactory.build(),)
+TIMEOUT_MESSAGE = re.compile("did not complete within")
+
 
 @dataclass(frozen=True, kw_only=True)
 class MockProvider(PipelineProvider[str]):
     """Test provider that returns configurable poll responses."""
 
     poll_responses: Sequence[Sequence[TestResult] | None] = field(default_factory=list)
-    _poll_count: list[int] = field(default_factory=lambda: [0])
+    _polled: list[str] = field(default_factory=list)
+    _responses: Iterator[Sequence[TestResult] | None] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Iterate poll_responses in order across polls."""
+        object.__setattr__(self, "_responses", iter(self.poll_responses))
 
     async def dispatch_scanner_tests(
         self,
@@ -33,11 +44,8 @@ class MockProvider(PipelineProvider[str]):
         dispatch_state: str,
     ) -> Sequence[TestResult] | None:
         """Return next response from poll_responses, then keep returning None."""
-        idx = self._poll_count[0]
-        self._poll_count[0] += 1
-        if idx < len(self.poll_responses):
-            return self.poll_responses[idx]
-        return None  # Never complete if responses exhausted
+        self._polled.append(dispatch_state)
+        return next(self._responses, None)  # Never complete if exhausted
 
 
 class TestWaitForCompletion:
@@ -45,32 +53,40 @@ class TestWaitForCompletion:
 
     async def test_returns_immediately_when_complete(self) -> None:
         """Returns results immediately when first poll shows complete."""
-        expected = [TestResultFactory.build()]
-        provider = MockProvider(poll_responses=[expected])
+        provider = MockProvider(poll_responses=[RESULTS])
 
         results = await provider.wait_for_completion("run-123", poll_interval=0.01)
 
-        assert results == expected
+        assert results == RESULTS
 
     async def test_polls_until_complete(self) -> None:
         """Keeps polling until results returned."""
-        expected = [TestResultFactory.build()]
-        provider = MockProvider(poll_responses=[None, None, expected])
+        provider = MockProvider(poll_responses=[None, None, RESULTS])
 
         results = await provider.wait_for_completion("run-123", poll_interval=0.01)
 
-        assert results == expected
-        assert provider._poll_count[0] == 3
+        assert results == RESULTS
+        assert len(provider._polled) == 3
 
     async def test_raises_timeout_error(self) -> None:
         """Raises TimeoutError when timeout exceeded."""
         provider = MockProvider(poll_responses=[None, None, None])
 
-        with pytest.raises(TimeoutError, match="did not complete within"):
+        with pytest.raises(TimeoutError, match=TIMEOUT_MESSAGE):
             await provider.wait_for_completion(
                 "run-123", timeout=0.05, poll_interval=0.02
             )
 
+    async def test_does_not_sleep_past_timeout(self) -> None:
+        """Raises at the deadline instead of sleeping a full poll interval."""
+        provider = MockProvider(poll_responses=[None, None])
+
+        async with asyncio.timeout(1):
+            with pytest.raises(TimeoutError, match=TIMEOUT_MESSAGE):
+                await provider.wait_for_completion(
+                    "run-123", timeout=0.05, poll_interval=60
+                )
+
     async def test_uses_dispatch_state(self) -> None:
         """Passes dispatch_state to poll_status."""
         calls: list[str] = []
@@ -128,7 +144,7 @@ class TestWaitForCompletion:
             ) -> Sequence[TestResult] | None:
                 assert dispatch_state.run_id == "123"
                 assert dispatch_state.extra_data["scanner"] == "org/scanner"
-                return [TestResultFactory.build()]
+                return RESULTS
 
         provider = ComplexProvider()
         state = await provider.dispatch_scanner_tests(
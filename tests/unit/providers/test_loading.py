@@ -1,14 +1,28 @@
 """Tests for provider loading module."""
 
+import re
+
 import pytest
 
 from scan_test_action.providers.github_actions import github_actions_manifest
 from scan_test_action.providers.loading import (
     ProviderNotFoundError,
     load_provider_manifest,
+    provider_entry_points,
+)
+
+UNKNOWN_PROVIDER_MESSAGE = re.compile(
+    r"'unknown-provider' not found\. Available providers"
 )
 
 
+def test_provider_entry_points_indexes_registered_providers() -> None:
+    """Indexes every registered provider entry point by key."""
+    entries = provider_entry_points()
+
+    assert set(entries) == {"azure-devops", "bitbucket", "github-actions", "gitlab-ci"}
+
+
 def test_load_provider_manifest_returns_manifest() -> None:
     """Loads provider manifest by key."""
     manifest = load_provider_manifest("github-actions")
@@ -18,8 +32,5 @@ def test_load_provider_manifest_returns_manifest() -> None:
 
 def test_load_provider_manifest_raises_for_unknown_provider() -> None:
     """Raises ProviderNotFoundError for unknown provider key."""
-    with pytest.raises(ProviderNotFoundError) as exc_info:
+    with pytest.raises(ProviderNotFoundError, match=UNKNOWN_PROVIDER_MESSAGE):
         load_provider_manifest("unknown-provider")
-
-    assert "unknown-provider" in str(exc_info.value)
-    assert "Available providers" in str(exc_info.value)
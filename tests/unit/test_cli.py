@@ -2,6 +2,7 @@
 
 import logging
 from pathlib import Path
+from typing import Literal
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -13,9 +14,9 @@ from scan_test_action.cli import (
     parse_fallback_scanners,
     run,
 )
+from scan_test_action.models.definition import TestDefinition
 from scan_test_action.models.result import TestResult
 from scan_test_action.orchestrator import ScannerResult
-from scan_test_action.testing.github.factories import TestDefinitionFactory
 
 
 def test_log_results_summary_success(caplog: pytest.LogCaptureFixture) -> None:
@@ -109,7 +110,7 @@ def test_log_results_summary_timeout(caplog: pytest.LogCaptureFixture) -> None:
 def test_log_results_summary_multiple_scanners(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
-    """Logs results for multiple scanners."""
+    """Logs results for multiple scanners in a single record."""
     scanner_results = [
         ScannerResult(
             scanner_id="org/scanner1",
@@ -140,6 +141,7 @@ def test_log_results_summary_multiple_scanners(
     assert "https://example.com/run/1" in caplog.text
     assert "❌ org/scanner2: failure (20.00s)" in caplog.text
     assert "https://example.com/run/2" in caplog.text
+    assert len(caplog.records) == 1
 
 
 def test_format_output_empty() -> None:
@@ -252,10 +254,10 @@ class TestParseFallbackScanners:
 class TestLoadTestDefinitions:
     """Tests for load_test_definitions function."""
 
-    async def test_loads_definitions_for_scanners(self) -> None:
+    async def test_loads_definitions_for_scanners(
+        self, test_def: TestDefinition
+    ) -> None:
         """Loads test definitions for given scanner IDs."""
-        test_def = TestDefinitionFactory.build()
-
         with patch(
             "scan_test_action.cli.load_test_definition",
             new_callable=AsyncMock,
@@ -267,6 +269,20 @@ class TestLoadTestDefinitions:
         assert result["org/scanner"] == test_def
         mock_load.assert_called_once_with(Path("/registry"), "org/scanner")
 
+    async def test_loads_duplicate_scanner_once(self, test_def: TestDefinition) -> None:
+        """Loads the definition of a repeated scanner ID only once."""
+        with patch(
+            "scan_test_action.cli.load_test_definition",
+            new_callable=AsyncMock,
+            return_value=test_def,
+        ) as mock_load:
+            result = await load_test_definitions(
+                Path("/registry"), ["org/scanner", "org/scanner"]
+            )
+
+        assert result == {"org/scanner": test_def}
+        mock_load.assert_called_once_with(Path("/registry"), "org/scanner")
+
     async def test_skips_missing_definitions(self) -> None:
         """Skips scanners without test definitions."""
         with patch(
@@ -278,6 +294,35 @@ class TestLoadTestDefinitions:
 
         assert result == {}
 
+    async def test_loads_multiple_scanners_skipping_missing(
+        self, test_def: TestDefinition
+    ) -> None:
+        """Loads every scanner and keeps only those with definitions."""
+
+        async def load(registry_path: Path, scanner_id: str) -> TestDefinition:
+            if scanner_id == "org/missing":
+                raise FileNotFoundError
+            return test_def
+
+        with patch("scan_test_action.cli.load_test_definition", side_effect=load):
+            result = await load_test_definitions(
+                Path("/registry"), ["org/scanner1", "org/missing", "org/scanner2"]
+            )
+
+        assert result == {"org/scanner1": test_def, "org/scanner2": test_def}
+
+    async def test_raises_invalid_definitions(self) -> None:
+        """Propagates errors other than a missing definition."""
+        with (
+            patch(
+                "scan_test_action.cli.load_test_definition",
+                new_callable=AsyncMock,
+                side_effect=ValueError("Invalid YAML"),
+            ),
+            pytest.raises(ValueError, match="Invalid YAML"),
+        ):
+            await load_test_definitions(Path("/registry"), ["org/scanner"])
+
 
 class TestRun:
     """Tests for run function."""
@@ -297,263 +342,131 @@ class TestRun:
         cm.__aexit__.return_value = None
         return cm
 
+    @pytest.fixture(autouse=True)
+    def mock_manifest(
+        self, monkeypatch: pytest.MonkeyPatch, mock_context_manager: AsyncMock
+    ) -> Mock:
+        """Load a manifest whose factory yields the mock provider."""
+        manifest = Mock()
+        manifest.provider_factory = Mock(return_value=mock_context_manager)
+        monkeypatch.setattr(
+            "scan_test_action.cli.load_provider_manifest", Mock(return_value=manifest)
+        )
+        return manifest
+
+    @pytest.fixture(autouse=True)
+    def mock_get_scanners(self, monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+        """Report a single changed scanner unless a test overrides it."""
+        mock = AsyncMock(return_value=["org/scanner"])
+        monkeypatch.setattr("scan_test_action.cli.get_scanners_to_test", mock)
+        return mock
+
+    @pytest.fixture(autouse=True)
+    def mock_load_definition(
+        self, monkeypatch: pytest.MonkeyPatch, test_def: TestDefinition
+    ) -> AsyncMock:
+        """Return the shared test definition for every scanner."""
+        mock = AsyncMock(return_value=test_def)
+        monkeypatch.setattr("scan_test_action.cli.load_test_definition", mock)
+        return mock
+
+    @pytest.fixture(autouse=True)
+    def mock_orchestrator(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        """Replace the orchestrator; tests set the results it returns."""
+        orchestrator = Mock()
+        orchestrator.run_tests = AsyncMock(return_value=[])
+        monkeypatch.setattr(
+            "scan_test_action.cli.TestOrchestrator", Mock(return_value=orchestrator)
+        )
+        return orchestrator
+
     async def test_returns_zero_when_no_changed_scanners(
-        self, capsys: pytest.CaptureFixture[str]
+        self, mock_get_scanners: AsyncMock, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """Returns 0 and prints empty results when no scanners changed."""
-        with (
-            patch("scan_test_action.cli.load_provider_manifest") as mock_load_manifest,
-            patch(
-                "scan_test_action.cli.get_scanners_to_test",
-                new_callable=AsyncMock,
-                return_value=[],
-            ),
-        ):
-            mock_manifest = Mock()
-            mock_manifest.config_cls = Mock(return_value=Mock())
-            mock_load_manifest.return_value = mock_manifest
-
-            exit_code = await run(
-                provider_key="github-actions",
-                provider_config_json='{"token": "test"}',
-                registry_path=Path("/registry"),
-                registry_repo="org/registry",
-                registry_ref="abc123",
-                base_ref="main",
-            )
+        mock_get_scanners.return_value = []
+
+        exit_code = await run(
+            provider_key="github-actions",
+            provider_config_json='{"token": "test"}',
+            registry_path=Path("/registry"),
+            registry_repo="org/registry",
+            registry_ref="abc123",
+            base_ref="main",
+        )
 
         assert exit_code == 0
         captured = capsys.readouterr()
         assert '"total": 0' in captured.out
 
     async def test_returns_zero_when_no_test_definitions(
-        self, capsys: pytest.CaptureFixture[str]
+        self, mock_load_definition: AsyncMock, mock_manifest: Mock
     ) -> None:
-        """Returns 0 when changed scanners have no test definitions."""
-        with (
-            patch("scan_test_action.cli.load_provider_manifest") as mock_load_manifest,
-            patch(
-                "scan_test_action.cli.get_scanners_to_test",
-                new_callable=AsyncMock,
-                return_value=["org/scanner"],
-            ),
-            patch(
-                "scan_test_action.cli.load_test_definition",
-                new_callable=AsyncMock,
-                side_effect=FileNotFoundError,
-            ),
-        ):
-            mock_manifest = Mock()
-            mock_manifest.config_cls = Mock(return_value=Mock())
-            mock_load_manifest.return_value = mock_manifest
-
-            exit_code = await run(
-                provider_key="github-actions",
-                provider_config_json='{"token": "test"}',
-                registry_path=Path("/registry"),
-                registry_repo="org/registry",
-                registry_ref="abc123",
-                base_ref="main",
-            )
+        """Returns 0 without starting the provider when no definitions exist."""
+        mock_load_definition.side_effect = FileNotFoundError
+
+        exit_code = await run(
+            provider_key="github-actions",
+            provider_config_json='{"token": "test"}',
+            registry_path=Path("/registry"),
+            registry_repo="org/registry",
+            registry_ref="abc123",
+            base_ref="main",
+        )
 
         assert exit_code == 0
+        mock_manifest.provider_factory.assert_not_called()
 
     async def test_returns_zero_when_all_tests_pass(
-        self,
-        mock_context_manager: AsyncMock,
-        mock_provider: Mock,
-        capsys: pytest.CaptureFixture[str],
+        self, mock_orchestrator: Mock, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """Returns 0 when all tests pass."""
-        test_def = TestDefinitionFactory.build()
-
-        with (
-            patch("scan_test_action.cli.load_provider_manifest") as mock_load_manifest,
-            patch(
-                "scan_test_action.cli.get_scanners_to_test",
-                new_callable=AsyncMock,
-                return_value=["org/scanner"],
-            ),
-            patch(
-                "scan_test_action.cli.load_test_definition",
-                new_callable=AsyncMock,
-                return_value=test_def,
-            ),
-            patch("scan_test_action.cli.TestOrchestrator") as mock_orchestrator_cls,
-        ):
-            mock_manifest = Mock()
-            mock_manifest.config_cls = Mock(return_value=Mock())
-            mock_manifest.provider_factory = Mock(return_value=mock_context_manager)
-            mock_load_manifest.return_value = mock_manifest
-
-            mock_orchestrator = Mock()
-            mock_orchestrator.run_tests = AsyncMock(
-                return_value=[
-                    ScannerResult(
-                        scanner_id="org/scanner",
-                        results=[TestResult(status="success", duration=10.0)],
-                    )
-                ]
-            )
-            mock_orchestrator_cls.return_value = mock_orchestrator
-
-            exit_code = await run(
-                provider_key="github-actions",
-                provider_config_json='{"token": "test"}',
-                registry_path=Path("/registry"),
-                registry_repo="org/registry",
-                registry_ref="abc123",
-                base_ref="main",
+        mock_orchestrator.run_tests.return_value = [
+            ScannerResult(
+                scanner_id="org/scanner",
+                results=[TestResult(status="success", duration=10.0)],
             )
+        ]
+
+        exit_code = await run(
+            provider_key="github-actions",
+            provider_config_json='{"token": "test"}',
+            registry_path=Path("/registry"),
+            registry_repo="org/registry",
+            registry_ref="abc123",
+            base_ref="main",
+        )
 
         assert exit_code == 0
         captured = capsys.readouterr()
         assert '"passed": 1' in captured.out
 
-    async def test_returns_one_when_test_fails(
-        self,
-        mock_context_manager: AsyncMock,
-        mock_provider: Mock,
-    ) -> None:
-        """Returns 1 when any test fails."""
-        test_def = TestDefinitionFactory.build()
-
-        with (
-            patch("scan_test_action.cli.load_provider_manifest") as mock_load_manifest,
-            patch(
-                "scan_test_action.cli.get_scanners_to_test",
-                new_callable=AsyncMock,
-                return_value=["org/scanner"],
-            ),
-            patch(
-                "scan_test_action.cli.load_test_definition",
-                new_callable=AsyncMock,
-                return_value=test_def,
-            ),
-            patch("scan_test_action.cli.TestOrchestrator") as mock_orchestrator_cls,
-        ):
-            mock_manifest = Mock()
-            mock_manifest.config_cls = Mock(return_value=Mock())
-            mock_manifest.provider_factory = Mock(return_value=mock_context_manager)
-            mock_load_manifest.return_value = mock_manifest
-
-            mock_orchestrator = Mock()
-            mock_orchestrator.run_tests = AsyncMock(
-                return_value=[
-                    ScannerResult(
-                        scanner_id="org/scanner",
-                        results=[TestResult(status="failure", duration=10.0)],
-                    )
-                ]
-            )
-            mock_orchestrator_cls.return_value = mock_orchestrator
-
-            exit_code = await run(
-                provider_key="github-actions",
-                provider_config_json='{"token": "test"}',
-                registry_path=Path("/registry"),
-                registry_repo="org/registry",
-                registry_ref="abc123",
-                base_ref="main",
-            )
-
-        assert exit_code == 1
-
-    async def test_returns_one_when_test_errors(
-        self,
-        mock_context_manager: AsyncMock,
-        mock_provider: Mock,
-    ) -> None:
-        """Returns 1 when any test errors."""
-        test_def = TestDefinitionFactory.build()
-
-        with (
-            patch("scan_test_action.cli.load_provider_manifest") as mock_load_manifest,
-            patch(
-                "scan_test_action.cli.get_scanners_to_test",
-                new_callable=AsyncMock,
-                return_value=["org/scanner"],
-            ),
-            patch(
-                "scan_test_action.cli.load_test_definition",
-                new_callable=AsyncMock,
-                return_value=test_def,
-            ),
-            patch("scan_test_action.cli.TestOrchestrator") as mock_orchestrator_cls,
-        ):
-            mock_manifest = Mock()
-            mock_manifest.config_cls = Mock(return_value=Mock())
-            mock_manifest.provider_factory = Mock(return_value=mock_context_manager)
-            mock_load_manifest.return_value = mock_manifest
-
-            mock_orchestrator = Mock()
-            mock_orchestrator.run_tests = AsyncMock(
-                return_value=[
-                    ScannerResult(
-                        scanner_id="org/scanner",
-                        results=[TestResult(status="error", duration=0.0)],
-                    )
-                ]
-            )
-            mock_orchestrator_cls.return_value = mock_orchestrator
-
-            exit_code = await run(
-                provider_key="github-actions",
-                provider_config_json='{"token": "test"}',
-                registry_path=Path("/registry"),
-                registry_repo="org/registry",
-                registry_ref="abc123",
-                base_ref="main",
-            )
-
-        assert exit_code == 1
-
-    async def test_returns_one_when_test_times_out(
+    @pytest.mark.parametrize(
+        ("status", "duration"),
+        [("failure", 10.0), ("error", 0.0), ("timeout", 600.0)],
+    )
+    async def test_returns_one_when_test_does_not_pass(
         self,
-        mock_context_manager: AsyncMock,
-        mock_provider: Mock,
+        status: Literal["failure", "error", "timeout"],
+        duration: float,
+        mock_orchestrator: Mock,
     ) -> None:
-        """Returns 1 when any test times out."""
-        test_def = TestDefinitionFactory.build()
-
-        with (
-            patch("scan_test_action.cli.load_provider_manifest") as mock_load_manifest,
-            patch(
-                "scan_test_action.cli.get_scanners_to_test",
-                new_callable=AsyncMock,
-                return_value=["org/scanner"],
-            ),
-            patch(
-                "scan_test_action.cli.load_test_definition",
-                new_callable=AsyncMock,
-                return_value=test_def,
-            ),
-            patch("scan_test_action.cli.TestOrchestrator") as mock_orchestrator_cls,
-        ):
-            mock_manifest = Mock()
-            mock_manifest.config_cls = Mock(return_value=Mock())
-            mock_manifest.provider_factory = Mock(return_value=mock_context_manager)
-            mock_load_manifest.return_value = mock_manifest
-
-            mock_orchestrator = Mock()
-            mock_orchestrator.run_tests = AsyncMock(
-                return_value=[
-                    ScannerResult(
-                        scanner_id="org/scanner",
-                        results=[TestResult(status="timeout", duration=600.0)],
-                    )
-                ]
-            )
-            mock_orchestrator_cls.return_value = mock_orchestrator
-
-            exit_code = await run(
-                provider_key="github-actions",
-                provider_config_json='{"token": "test"}',
-                registry_path=Path("/registry"),
-                registry_repo="org/registry",
-                registry_ref="abc123",
-                base_ref="main",
+        """Returns 1 when any test fails, errors or times out."""
+        mock_orchestrator.run_tests.return_value = [
+            ScannerResult(
+                scanner_id="org/scanner",
+                results=[TestResult(status=status, duration=duration)],
             )
+        ]
+
+        exit_code = await run(
+            provider_key="github-actions",
+            provider_config_json='{"token": "test"}',
+            registry_path=Path("/registry"),
+            registry_repo="org/registry",
+            registry_ref="abc123",
+            base_ref="main",
+        )
 
         assert exit_code == 1
 
@@ -1,21 +1,15 @@
 """Tests for definition loader."""
 
+from collections.abc import Mapping
 from pathlib import Path
 
 import pytest
 
 from scan_test_action.definition_loader import load_test_definition
 
-
-class TestLoadTestDefinition:
-    """Tests for load_test_definition function."""
-
-    async def test_loads_valid_yaml(self, tmp_path: Path) -> None:
-        """Loads and parses valid tests.yaml file."""
-        scanner_dir = tmp_path / "scanners" / "org" / "scanner"
-        scanner_dir.mkdir(parents=True)
-        (scanner_dir / "tests.yaml").write_text(
-            """
+# tests.yaml content per scanner ID, written once into a shared registry
+SCANNER_TEST_FILES: Mapping[str, str] = {
+    "org/valid": """
 version: "1.0"
 tests:
   - name: "smoke test"
@@ -26,24 +20,8 @@ tests:
     scan_paths:
       - "."
     timeout: "5m"
-"""
-        )
-
-        definition = await load_test_definition(tmp_path, "org/scanner")
-
-        assert definition.version == "1.0"
-        assert len(definition.tests) == 1
-        assert definition.tests[0].name == "smoke test"
-        assert definition.tests[0].type == "source-code"
-        assert definition.tests[0].source.url == "https://github.com/org/repo.git"
-        assert definition.tests[0].source.ref == "main"
-
-    async def test_loads_multiple_tests(self, tmp_path: Path) -> None:
-        """Handles multiple tests in definition."""
-        scanner_dir = tmp_path / "scanners" / "org" / "scanner"
-        scanner_dir.mkdir(parents=True)
-        (scanner_dir / "tests.yaml").write_text(
-            """
+""",
+    "org/multi": """
 version: "1.0"
 tests:
   - name: "test1"
@@ -56,68 +34,82 @@ tests:
     source:
       url: "https://github.com/org/repo2.git"
       ref: "v1.0"
-"""
-        )
+""",
+    "org/invalid-yaml": "invalid: yaml: content: [",
+    "org/empty": "",
+    "org/invalid-schema": """
+version: "1.0"
+tests:
+  - name: "test"
+    type: "invalid-type"
+    source:
+      url: "https://github.com/org/repo.git"
+      ref: "main"
+""",
+    "org/missing-fields": """
+tests:
+  - name: "test"
+    type: "source-code"
+""",
+}
+
+
+@pytest.fixture(scope="session")
+def registry_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one registry holding a scanner per scenario, shared by all tests."""
+    registry = tmp_path_factory.mktemp("registry")
+    for scanner_id, content in SCANNER_TEST_FILES.items():
+        scanner_dir = registry / "scanners" / scanner_id
+        scanner_dir.mkdir(parents=True)
+        (scanner_dir / "tests.yaml").write_text(content)
+    return registry
+
 
-        definition = await load_test_definition(tmp_path, "org/scanner")
+class TestLoadTestDefinition:
+    """Tests for load_test_definition function."""
+
+    async def test_loads_valid_yaml(self, registry_path: Path) -> None:
+        """Loads and parses valid tests.yaml file."""
+        definition = await load_test_definition(registry_path, "org/valid")
+
+        assert definition.version == "1.0"
+        assert len(definition.tests) == 1
+        assert definition.tests[0].name == "smoke test"
+        assert definition.tests[0].type == "source-code"
+        assert definition.tests[0].source.url == "https://github.com/org/repo.git"
+        assert definition.tests[0].source.ref == "main"
+
+    async def test_loads_multiple_tests(self, registry_path: Path) -> None:
+        """Handles multiple tests in definition."""
+        definition = await load_test_definition(registry_path, "org/multi")
 
         assert len(definition.tests) == 2
         assert definition.tests[0].name == "test1"
         assert definition.tests[1].name == "test2"
 
-    async def test_raises_for_missing_file(self, tmp_path: Path) -> None:
+    async def test_raises_for_missing_file(self, registry_path: Path) -> None:
         """Raises FileNotFoundError for missing tests.yaml."""
         with pytest.raises(FileNotFoundError, match="Test file not found"):
-            await load_test_definition(tmp_path, "org/nonexistent")
+            await load_test_definition(registry_path, "org/nonexistent")
 
-    async def test_raises_for_invalid_yaml(self, tmp_path: Path) -> None:
+    async def test_raises_for_invalid_yaml(self, registry_path: Path) -> None:
         """Raises ValueError for malformed YAML."""
-        scanner_dir = tmp_path / "scanners" / "org" / "scanner"
-        scanner_dir.mkdir(parents=True)
-        (scanner_dir / "tests.yaml").write_text("invalid: yaml: content: [")
-
         with pytest.raises(ValueError, match="Invalid YAML"):
-            await load_test_definition(tmp_path, "org/scanner")
+            await load_test_definition(registry_path, "org/invalid-yaml")
 
-    async def test_raises_for_empty_file(self, tmp_path: Path) -> None:
+    async def test_raises_for_empty_file(self, registry_path: Path) -> None:
         """Raises ValueError for empty tests.yaml."""
-        scanner_dir = tmp_path / "scanners" / "org" / "scanner"
-        scanner_dir.mkdir(parents=True)
-        (scanner_dir / "tests.yaml").write_text("")
-
         with pytest.raises(ValueError, match="Empty test file"):
-            await load_test_definition(tmp_path, "org/scanner")
+            await load_test_definition(registry_path, "org/empty")
 
-    async def test_raises_for_invalid_schema(self, tmp_path: Path) -> None:
+    async def test_raises_for_invalid_schema(self, registry_path: Path) -> None:
         """Raises ValueError for schema validation errors."""
-        scanner_dir = tmp_path / "scanners" / "org" / "scanner"
-        scanner_dir.mkdir(parents=True)
-        (scanner_dir / "tests.yaml").write_text(
-            """
-version: "1.0"
-tests:
-  - name: "test"
-    type: "invalid-type"
-    source:
-      url: "https://github.com/org/repo.git"
-      ref: "main"
-"""
-        )
-
         with pytest.raises(ValueError, match="Invalid test definition schema"):
-            await load_test_definition(tmp_path, "org/scanner")
+            await load_test_definition(registry_path, "org/invalid-schema")
 
-    async def test_raises_for_missing_required_fields(self, tmp_path: Path) -> None:
+    async def test_raises_for_missing_required_fields(
+        self, registry_path: Path
+    ) -> None:
         """Raises ValueError when required fields are missing."""
-        scanner_dir = tmp_path / "scanners" / "org" / "scanner"
-        scanner_dir.mkdir(parents=True)
-        (scanner_dir / "tests.yaml").write_text(
-            """
-tests:
-  - name: "test"
-    type: "source-code"
-"""
-        )
-
         with pytest.raises(ValueError, match="Invalid test definition schema"):
-            await load_test_definition(tmp_path, "org/scanner")
+            await load_test_definition(registry_path, "org/missing-fields")
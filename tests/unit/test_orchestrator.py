@@ -4,10 +4,10 @@ from unittest.mock import Mock
 
 import pytest
 
+from scan_test_action.models.definition import TestDefinition
 from scan_test_action.models.result import TestResult
 from scan_test_action.orchestrator import TestOrchestrator
 from scan_test_action.providers.base import PipelineProvider
-from scan_test_action.testing.github.factories import TestDefinitionFactory
 
 
 @pytest.fixture
@@ -40,10 +40,9 @@ async def test_returns_empty_when_no_test_definitions(
 async def test_runs_single_scanner_test(
     orchestrator: TestOrchestrator[str],
     provider_mock: Mock,
+    test_def: TestDefinition,
 ) -> None:
     """Runs test for a single scanner and returns results."""
-    test_def = TestDefinitionFactory.build()
-
     provider_mock.dispatch_scanner_tests.return_value = "run-123"
     provider_mock.wait_for_completion.return_value = [
         TestResult(status="success", duration=10.5, run_url="https://example.com")
@@ -69,11 +68,10 @@ async def test_runs_single_scanner_test(
 async def test_runs_multiple_scanners_in_parallel(
     orchestrator: TestOrchestrator[str],
     provider_mock: Mock,
+    test_def: TestDefinition,
+    test_def2: TestDefinition,
 ) -> None:
     """Runs tests for multiple scanners in parallel."""
-    test_def1 = TestDefinitionFactory.build()
-    test_def2 = TestDefinitionFactory.build()
-
     provider_mock.dispatch_scanner_tests.side_effect = ["run-1", "run-2"]
     provider_mock.wait_for_completion.side_effect = [
         [TestResult(status="success", duration=10.0)],
@@ -81,7 +79,7 @@ async def test_runs_multiple_scanners_in_parallel(
     ]
 
     results = await orchestrator.run_tests(
-        test_definitions={"scanner1": test_def1, "scanner2": test_def2},
+        test_definitions={"scanner1": test_def, "scanner2": test_def2},
         registry_repo="org/registry",
         registry_ref="abc123",
     )
@@ -94,10 +92,9 @@ async def test_runs_multiple_scanners_in_parallel(
 async def test_handles_exception_during_wait(
     orchestrator: TestOrchestrator[str],
     provider_mock: Mock,
+    test_def: TestDefinition,
 ) -> None:
     """Handles exceptions during wait_for_completion and returns error results."""
-    test_def = TestDefinitionFactory.build()
-
     provider_mock.dispatch_scanner_tests.return_value = "run-123"
     provider_mock.wait_for_completion.side_effect = RuntimeError("API Error")
 
@@ -116,10 +113,9 @@ async def test_handles_exception_during_wait(
 async def test_handles_exception_during_dispatch(
     orchestrator: TestOrchestrator[str],
     provider_mock: Mock,
+    test_def: TestDefinition,
 ) -> None:
     """Handles exceptions during dispatch and returns error results."""
-    test_def = TestDefinitionFactory.build()
-
     provider_mock.dispatch_scanner_tests.side_effect = RuntimeError("Dispatch failed")
 
     results = await orchestrator.run_tests(
@@ -137,11 +133,10 @@ async def test_handles_exception_during_dispatch(
 async def test_continues_on_partial_failure(
     orchestrator: TestOrchestrator[str],
     provider_mock: Mock,
+    test_def: TestDefinition,
+    test_def2: TestDefinition,
 ) -> None:
     """Continues processing when one scanner fails."""
-    test_def1 = TestDefinitionFactory.build()
-    test_def2 = TestDefinitionFactory.build()
-
     provider_mock.dispatch_scanner_tests.side_effect = ["run-1", "run-2"]
     provider_mock.wait_for_completion.side_effect = [
         [TestResult(status="success", duration=10.0)],
@@ -149,7 +144,7 @@ async def test_continues_on_partial_failure(
     ]
 
     results = await orchestrator.run_tests(
-        test_definitions={"scanner1": test_def1, "scanner2": test_def2},
+        test_definitions={"scanner1": test_def, "scanner2": test_def2},
         registry_repo="org/registry",
         registry_ref="abc123",
     )